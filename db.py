@@ -0,0 +1,40 @@
+# db.py
+import sqlite3
+from contextlib import contextmanager
+
+
+DB_PATH = "jobs.db"
+
+
+def connect_db(path: str = DB_PATH) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    # WAL + synchronous=NORMAL: commits append to the log instead of fsyncing
+    # the rollback journal and database file every time
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    return conn
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection):
+    """
+    Run the block atomically. Inside a transaction the caller already has
+    open, use a savepoint so only this block is rolled back on error and
+    the caller still decides whether to commit.
+    """
+    if conn.in_transaction:
+        conn.execute("SAVEPOINT nested")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK TO nested")
+            conn.execute("RELEASE nested")
+            raise
+        conn.execute("RELEASE nested")
+    else:
+        with conn:
+            conn.execute("BEGIN")
+            yield conn
@@ -2,18 +2,39 @@
 """
 Export new jobs (is_new=1) to CSV file in a dated folder.
 """
-import sqlite3
 import csv
 import sys
 import os
-from datetime import datetime
+import itertools
+from datetime import datetime, timedelta
 
-DB_PATH = "jobs.db"
+from db import DB_PATH, connect_db
+
+CSV_HEADER = [
+    'Source', 'Company', 'Job ID', 'Title', 'Location',
+    'URL', 'Score', 'First Seen', 'Last Seen'
+]
+
+
+def write_jobs_csv(output_file, rows):
+    """Stream rows (e.g. a live cursor) into a CSV file. Returns number of rows written."""
+    counter = itertools.count()
+    # 1 MiB buffer: rows are flushed to disk in a few large writes
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        # zip() stops on rows before advancing the counter, so it ends at len(rows)
+        writer.writerows(row for row, _ in zip(rows, counter))
+    return next(counter)
 
 
 def export_new_jobs_to_csv():
     """Export all new jobs to CSV in a dated folder, sorted by score, then mark them as not new."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = connect_db(DB_PATH)
+    
+    # Take the write lock up front so no scrape can add is_new rows between
+    # the SELECT and the UPDATE that clears them
+    conn.execute("BEGIN IMMEDIATE")
     
     cur = conn.execute(
         """
@@ -24,9 +45,10 @@ def export_new_jobs_to_csv():
         """
     )
     
-    jobs = cur.fetchall()
+    first = next(cur, None)
     
-    if not jobs:
+    if first is None:
+        conn.rollback()
         conn.close()
         print("No new jobs found.")
         return 0
@@ -39,67 +61,56 @@ def export_new_jobs_to_csv():
     output_file = f"{output_dir}/new_jobs.csv"
     
     # Write to CSV
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        # Header
-        writer.writerow([
-            'Source', 'Company', 'Job ID', 'Title', 'Location', 
-            'URL', 'Score', 'First Seen', 'Last Seen'
-        ])
-        # Data rows
-        for job in jobs:
-            writer.writerow(job)
+    exported = write_jobs_csv(output_file, itertools.chain([first], cur))
     
     # Mark exported jobs as not new
+    conn.execute("UPDATE jobs SET is_new = 0 WHERE is_new = 1")
+    conn.commit()
     conn.close()
     
-    print(f"Exported {len(jobs)} new jobs to {output_file}")
-    return len(jobs), output_file
+    print(f"Exported {exported} new jobs to {output_file}")
+    return exported, output_file
 
 
 def export_top_jobs_by_score(limit=50):
     """Export top N jobs by score to CSV, regardless of is_new status."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = connect_db(DB_PATH)
     
-    today = datetime.now().strftime("%Y-%m-%d")
+    now = datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    tomorrow = (now + timedelta(days=1)).strftime("%Y-%m-%d")
 
+    # first_seen is an ISO timestamp, so a string range selects the day and,
+    # unlike DATE(first_seen), can use idx_jobs_first_seen
     cur = conn.execute(
         """
         SELECT source, company, job_id, title, location, url, score, first_seen, last_seen
         FROM jobs
-        WHERE DATE(first_seen) = ?
+        WHERE first_seen >= ? AND first_seen < ?
         ORDER BY score DESC, last_seen DESC
         """,
-        (today,)
+        (today, tomorrow)
     )
         
-    jobs = cur.fetchall()
+    first = next(cur, None)
     
-    if not jobs:
+    if first is None:
+        conn.close()
         print("No jobs found.")
         return 0
     
     # Create dated folder (YYYY-MM-DD format)
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    output_dir = f"exports/{date_str}/top-jobs"
+    output_dir = f"exports/{today}/top-jobs"
     os.makedirs(output_dir, exist_ok=True)
     
     output_file = f"{output_dir}/top_{limit}_jobs.csv"
     
     # Write to CSV
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        # Header
-        writer.writerow([
-            'Source', 'Company', 'Job ID', 'Title', 'Location', 
-            'URL', 'Score', 'First Seen', 'Last Seen'
-        ])
-        # Data rows
-        for job in jobs:
-            writer.writerow(job)
-    
-    print(f"Exported top {len(jobs)} jobs by score to {output_file}")
-    return len(jobs), output_file
+    exported = write_jobs_csv(output_file, itertools.chain([first], cur))
+    conn.close()
+    
+    print(f"Exported top {exported} jobs by score to {output_file}")
+    return exported, output_file
 
 
 if __name__ == "__main__":
@@ -1,4 +1,11 @@
 # filters.py
+import re
+from collections import namedtuple
+from functools import lru_cache
+from typing import Callable
+
+# One scraped posting; scrapers' dicts are converted to this once per run
+Job = namedtuple("Job", "source company job_id title location url")
 
 # ------------------
 # SCORING WEIGHTS
@@ -14,12 +21,12 @@ TITLE_KEYWORD_SCORES = {
     "data scientist": 3,
     "research scientist": 3,
     "research engineer": 6,
-    "Ops": 4,
+    "ops": 4,
     "software": 2,
     "data": 2,
     "member of technical staff": 4,
     "design": 2,
-    "genAI": 4,
+    "genai": 9,
     "gen ai": 4,
     "gen-ai": 4,
     "generative ai": 4,
@@ -43,19 +50,38 @@ TITLE_KEYWORD_SCORES = {
     "single cell": 3,
     "transcriptomics": 2,
     "systems biology": 2,
+    # inflections and compounds: keywords match whole words, so these
+    # carry the weight substring matching used to give them
+    # (e.g. "mlops" scored as "ml" + "ops")
+    "engineering": 3,
+    "engineers": 3,
+    "bioengineer": 3,
+    "scientists": 5,
+    "designer": 2,
+    "devops": 4,
+    "devsecops": 4,
+    "engops": 4,
+    "mlops": 9,
+    "aiops": 9,
+    "datacenter": 2,
+    "biotherapeutics": 2,
 }
 
 TITLE_PENALTIES = {
     "intern": -10,
-    "internship": -10,
+    "internship": -20,
     "manager": -10,
+    "managers": -10,
     "director": -10,
+    "directors": -10,
     "vp": -10,
+    "svp": -10,
     "principal": -10,
     "staff": -10,
     "qa": -10,
+    "swqa": -10,
     "quality assurance": -10,
-    "postdoctoral": -5,
+    "postdoctoral": -10,
     "postdoc": -5,
     "assistant professor": -8,
     "faculty": -8,
@@ -68,7 +94,7 @@ LOCATION_SCORES = {
     "cambridge": 5,
     "somerville": 5,
     "framingham": 5,
-    "massachusetts": 5,
+    "massachusetts": 10,
     "ma": 5,
     "san francisco": 4,
     "san jose": 4,
@@ -89,7 +115,6 @@ LOCATION_SCORES = {
     "washington dc": 2,
     "washington": 2,
     "new jersey": 2,
-    "new jersey": 2,
     "seattle": 3,
     "remote": 1,
 }
@@ -110,42 +135,58 @@ REMOTE_BONUS = 0
 # Helpers
 # ------------------
 
-def _norm(s: str | None) -> str:
-    return s.lower() if s else ""
+# Words are runs of letters/digits; scoring compares whole words, so "ai"
+# no longer matches inside "explainability" nor "ma" inside "germany"
+_WORD_RE = re.compile(r"[^\W_]+")
 
-def score_title(title: str | None) -> int:
-    t = _norm(title)
-    score = 0
+def _words(s: str | None) -> list[str]:
+    return _WORD_RE.findall(s.lower()) if s else []
 
-    for k, v in TITLE_KEYWORD_SCORES.items():
-        if k in t:
-            score += v
+def _compile(*tables: dict[str, int]) -> Callable[[list[str]], int]:
+    """
+    Build a scorer that sums the weights of every keyword found in a list of words.
+    A keyword counts once no matter how often it occurs.
+    """
+    weights = {" ".join(_words(k)): v for table in tables for k, v in table.items()}
 
-    for k, v in TITLE_PENALTIES.items():
-        if k in t:
-            score += v
+    # Single-word keywords: one set intersection with the text's words
+    word_weights = {k: v for k, v in weights.items() if " " not in k}
+    word_set = frozenset(word_weights)
 
-    return score
+    # Multi-word keywords: a padded substring test per phrase, so phrases can
+    # share or extend each other's words (e.g. "gen ai" and "ai scientist")
+    phrases = tuple((f" {k} ", v) for k, v in weights.items() if " " in k)
 
-def score_location(location: str | None) -> int:
-    loc = _norm(location)
-    score = 0
+    def scan(words: list[str]) -> int:
+        score = sum(word_weights[w] for w in word_set.intersection(words))
+        if phrases and len(words) > 1:
+            text = " " + " ".join(words) + " "
+            score += sum(v for p, v in phrases if p in text)
+        return score
 
-    for k, v in LOCATION_SCORES.items():
-        if k in loc:
-            score += v
+    return scan
 
-    for k, v in LOCATION_PENALTIES.items():
-        if k in loc:
-            score += v
+_TITLE_SCAN = _compile(TITLE_KEYWORD_SCORES, TITLE_PENALTIES)
+_LOCATION_SCAN = _compile(LOCATION_SCORES, LOCATION_PENALTIES)
+
+# The keyword tables are fixed at import, so a score depends only on its
+# string; titles and especially locations repeat across boards and runs
+@lru_cache(maxsize=4096)
+def score_title(title: str | None) -> int:
+    return _TITLE_SCAN(_words(title))
+
+@lru_cache(maxsize=4096)
+def score_location(location: str | None) -> int:
+    words = _words(location)
+    score = _LOCATION_SCAN(words)
 
-    if "remote" in loc:
+    if REMOTE_BONUS and "remote" in words:
         score += REMOTE_BONUS
 
     return score
 
-def score_job(job: dict) -> int:
+def score_job(job: Job) -> int:
     return (
-        score_title(job.get("title"))
-        + score_location(job.get("location"))
+        score_title(job.title)
+        + score_location(job.location)
     )
@@ -1,23 +1,27 @@
 # main.py
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from urllib.parse import urlparse
 
 import yaml
 
 from scrapers import scrape_greenhouse, scrape_lever, extract_lever_account, scrape_ashby, extract_ashby_board, scrape_workday, scrape_smartrecruiters, extract_smartrecruiters_company, scrape_bamboohr, scrape_dover, scrape_polymer_board, scrape_pinpoint_jobs, scrape_avature_jobs
-from filters import score_job
+from db import DB_PATH, connect_db, transaction
+from filters import Job, score_job
 
 
-DB_PATH = "jobs.db"
 YAML_PATH = "companies.yaml"
 
 
+@lru_cache(maxsize=512)
 def extract_greenhouse_token(greenhouse_url: str) -> str:
     # e.g. https://job-boards.greenhouse.io/cellarity -> "cellarity"
     return urlparse(greenhouse_url).path.strip("/").split("/")[-1]
 
 
+@lru_cache(maxsize=512)
 def construct_workday_jobs_api_url(careers_url: str) -> str:
     # e.g. https://vrtx.wd501.myworkdayjobs.com/vertex_careers
     # -> https://vrtx.wd501.myworkdayjobs.com/wday/cxs/vrtx/vertex_careers/jobs
@@ -37,40 +41,79 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+JOBS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        source      TEXT NOT NULL,
+        company     TEXT NOT NULL,
+        job_id      TEXT NOT NULL,
+        title       TEXT,
+        location    TEXT,
+        url         TEXT,
+        score       INTEGER DEFAULT 0,
+        is_new      INTEGER DEFAULT 0,
+        is_applied  INTEGER DEFAULT 0,
+        first_seen  TEXT NOT NULL,
+        last_seen   TEXT NOT NULL,
+        PRIMARY KEY (source, company, job_id)
+    ) WITHOUT ROWID;
+"""
+JOBS_COLUMNS = "source, company, job_id, title, location, url, score, is_new, is_applied, first_seen, last_seen"
+
+
 def init_db(conn: sqlite3.Connection) -> None:
+    # WITHOUT ROWID: rows live in one B-tree keyed by the primary key, instead
+    # of a rowid table plus a separate primary-key index
+    conn.execute(JOBS_TABLE_SQL.format(table="jobs"))
+    # Migrations run once per database, tracked in PRAGMA user_version
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version < 1:
+        # Add score column if it doesn't exist (for existing databases)
+        try:
+            conn.execute("ALTER TABLE jobs ADD COLUMN score INTEGER DEFAULT 0")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        # Add is_new column if it doesn't exist (for existing databases)
+        try:
+            conn.execute("ALTER TABLE jobs ADD COLUMN is_new INTEGER DEFAULT 0")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        # Add is_applied column if it doesn't exist (for existing databases)
+        try:
+            conn.execute("ALTER TABLE jobs ADD COLUMN is_applied INTEGER DEFAULT 0")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        conn.execute("PRAGMA user_version = 1")
+    # New databases are created WITHOUT ROWID above and need no rebuild
+    table_sql = conn.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='jobs'").fetchone()[0]
+    if version < 2 and "WITHOUT ROWID" not in table_sql.upper():
+        # Rebuild tables created before WITHOUT ROWID (indexes are recreated below)
+        conn.execute("BEGIN")
+        conn.execute(JOBS_TABLE_SQL.format(table="jobs_new"))
+        conn.execute(f"INSERT INTO jobs_new ({JOBS_COLUMNS}) SELECT {JOBS_COLUMNS} FROM jobs")
+        conn.execute("DROP TABLE jobs")
+        conn.execute("ALTER TABLE jobs_new RENAME TO jobs")
+        conn.execute("PRAGMA user_version = 2")
+        conn.commit()
+    if version < 3:
+        # Indexes from earlier versions of the export queries
+        conn.execute("DROP INDEX IF EXISTS idx_jobs_new_score")
+        conn.execute("DROP INDEX IF EXISTS idx_jobs_first_seen_cover")
+        conn.execute("PRAGMA user_version = 3")
+    # Covering index for the new-jobs export: it holds every exported column,
+    # so the export is answered without reading table rows. is_new is listed
+    # too: SQLite only treats a partial index as covering if it contains the
+    # columns of its own WHERE clause. Being partial, it only holds unexported
+    # jobs, so upserts of already-seen jobs do not touch it.
     conn.execute(
         """
-        CREATE TABLE IF NOT EXISTS jobs (
-            source      TEXT NOT NULL,
-            company     TEXT NOT NULL,
-            job_id      TEXT NOT NULL,
-            title       TEXT,
-            location    TEXT,
-            url         TEXT,
-            score       INTEGER DEFAULT 0,
-            is_new      INTEGER DEFAULT 0,
-            is_applied  INTEGER DEFAULT 0,
-            first_seen  TEXT NOT NULL,
-            last_seen   TEXT NOT NULL,
-            PRIMARY KEY (source, company, job_id)
-        );
+        CREATE INDEX IF NOT EXISTS idx_jobs_export_cover
+        ON jobs (score DESC, last_seen DESC, source, company, job_id, title, location, url, first_seen, is_new)
+        WHERE is_new = 1
         """
     )
-    # Add score column if it doesn't exist (for existing databases)
-    try:
-        conn.execute("ALTER TABLE jobs ADD COLUMN score INTEGER DEFAULT 0")
-    except sqlite3.OperationalError:
-        pass  # Column already exists
-    # Add is_new column if it doesn't exist (for existing databases)
-    try:
-        conn.execute("ALTER TABLE jobs ADD COLUMN is_new INTEGER DEFAULT 0")
-    except sqlite3.OperationalError:
-        pass  # Column already exists
-    # Add is_applied column if it doesn't exist (for existing databases)
-    try:
-        conn.execute("ALTER TABLE jobs ADD COLUMN is_applied INTEGER DEFAULT 0")
-    except sqlite3.OperationalError:
-        pass  # Column already exists
+    # The top-jobs export reads a single day's rows; first_seen never changes
+    # after insert, so this index costs upserts nothing
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_first_seen ON jobs (first_seen)")
     conn.commit()
 
 
@@ -86,25 +129,40 @@ def recalculate_all_scores(conn: sqlite3.Connection) -> int:
     Useful when scoring rules change.
     Returns number of jobs updated.
     """
-    cur = conn.execute("SELECT source, company, job_id, title, location FROM jobs")
-    jobs = cur.fetchall()
-    
-    updated = 0
-    for source, company, job_id, title, location in jobs:
-        job = {"title": title, "location": location}
-        job_score = score_job(job)
-        
+    cur = conn.execute("SELECT source, company, job_id, title, location, url FROM jobs")
+    rows = [(row[0], row[1], row[2], score_job(Job(*row))) for row in cur]
+
+    # Stage the new scores in a temp table and apply them with one UPDATE,
+    # rather than one UPDATE statement per job
+    with transaction(conn):
         conn.execute(
-            "UPDATE jobs SET score=? WHERE source=? AND company=? AND job_id=?",
-            (job_score, source, company, job_id),
+            """
+            CREATE TEMP TABLE _scores (
+                source  TEXT,
+                company TEXT,
+                job_id  TEXT,
+                score   INTEGER,
+                PRIMARY KEY (source, company, job_id)
+            )
+            """
         )
-        updated += 1
-    
-    conn.commit()
-    return updated
+        conn.executemany("INSERT INTO _scores VALUES (?, ?, ?, ?)", rows)
+        conn.execute(
+            """
+            UPDATE jobs
+            SET score = (
+                SELECT score FROM _scores
+                WHERE _scores.source=jobs.source AND _scores.company=jobs.company AND _scores.job_id=jobs.job_id
+            )
+            WHERE (source, company, job_id) IN (SELECT source, company, job_id FROM _scores)
+            """
+        )
+        conn.execute("DROP TABLE _scores")
+
+    return len(rows)
 
 
-def get_jobs_by_score(conn: sqlite3.Connection, min_score: int = None, limit: int = None) -> list[dict]:
+def get_jobs_by_score(conn: sqlite3.Connection, min_score: int = None, limit: int = None) -> list[sqlite3.Row]:
     """
     Get jobs sorted by score (highest first).
     Optionally filter by minimum score and limit results.
@@ -122,256 +180,255 @@ def get_jobs_by_score(conn: sqlite3.Connection, min_score: int = None, limit: in
         query += " LIMIT ?"
         params.append(limit)
     
-    cur = conn.execute(query, params)
-    rows = cur.fetchall()
-    
-    return [
-        {
-            "source": row[0],
-            "company": row[1],
-            "job_id": row[2],
-            "title": row[3],
-            "location": row[4],
-            "url": row[5],
-            "score": row[6],
-            "first_seen": row[7],
-            "last_seen": row[8],
-        }
-        for row in rows
-    ]
+    # sqlite3.Row gives name-based access (row["title"]) without building a dict per row;
+    # set on this cursor only so the caller's connection keeps its row factory
+    cur = conn.cursor()
+    cur.row_factory = sqlite3.Row
+    cur.execute(query, params)
+    return cur.fetchall()
 
 
-def upsert_jobs(conn: sqlite3.Connection, jobs: list[dict]) -> list[dict]:
+def upsert_jobs(conn: sqlite3.Connection, jobs: list[Job]) -> list[tuple[Job, int]]:
     """
     Insert jobs we haven't seen; update last_seen for jobs we have.
     Calculates and stores score for each job.
-    Returns list of NEW jobs (inserted this run).
+    Returns (job, score) for each NEW job (inserted this run).
     """
     now = utc_now_iso()
+    rows = [
+        (j.source, j.company, j.job_id, j.title, j.location, j.url, score_job(j), now, now)
+        for j in jobs
+    ]
     new_jobs = []
 
-    for j in jobs:
-        source = j["source"]
-        company = j["company"]
-        job_id = str(j["job_id"])
-        title = j.get("title")
-        location = j.get("location")
-        url = j.get("url")
-        
-        # Calculate score for this job
-        job_score = score_job(j)
+    with transaction(conn):
+        # One lookup per board (served by the primary key) instead of one per job
+        known = set()
+        for source, company in {row[:2] for row in rows}:
+            cur = conn.execute(
+                "SELECT job_id FROM jobs WHERE source=? AND company=?",
+                (source, company),
+            )
+            known.update((source, company, job_id) for (job_id,) in cur)
 
-        cur = conn.execute(
+        for j, row in zip(jobs, rows):
+            if row[:3] not in known:
+                known.add(row[:3])
+                new_jobs.append((j, row[6]))
+
+        conn.executemany(
             """
-            SELECT 1 FROM jobs
-            WHERE source=? AND company=? AND job_id=?
+            INSERT INTO jobs (source, company, job_id, title, location, url, score, is_new, is_applied, first_seen, last_seen)
+            VALUES (?, ?, ?, ?, ?, ?, ?, 1, 0, ?, ?)
+            ON CONFLICT (source, company, job_id) DO UPDATE
+            SET title=excluded.title, location=excluded.location, url=excluded.url,
+                score=excluded.score, is_new=0, last_seen=excluded.last_seen
             """,
-            (source, company, job_id),
+            rows,
         )
-        exists = cur.fetchone() is not None
-
-        if exists:
-            conn.execute(
-                """
-                UPDATE jobs
-                SET title=?, location=?, url=?, score=?, is_new=0, last_seen=?
-                WHERE source=? AND company=? AND job_id=?
-                """,
-                (title, location, url, job_score, now, source, company, job_id),
-            )
-        else:
-            conn.execute(
-                """
-                INSERT INTO jobs (source, company, job_id, title, location, url, score, is_new, is_applied, first_seen, last_seen)
-                VALUES (?, ?, ?, ?, ?, ?, ?, 1, 0, ?, ?)
-                """,
-                (source, company, job_id, title, location, url, job_score, now, now),
-            )
-            new_jobs.append(j)
 
-    conn.commit()
     return new_jobs
 
 
+def scrape_one(c: dict) -> tuple[str, list[Job] | None]:
+    """
+    Scrape a single company entry from companies.yaml.
+    Returns (name, jobs); jobs is None if the entry was skipped or the scrape failed.
+    """
+    name = c.get("name") or "Unknown"
+    company_type = c.get("type")
+    
+    if company_type == "greenhouse":
+        greenhouse_url = c.get("greenhouse_url") or c.get("url")
+        if not greenhouse_url:
+            print(f"Skipping {name}: missing greenhouse_url")
+            return name, None
+
+        token = extract_greenhouse_token(greenhouse_url)
+
+        try:
+            jobs = scrape_greenhouse(token)
+        except Exception as e:
+            print(f"[ERROR] {name} ({token}): {e}")
+            return name, None
+
+    elif company_type == "lever":
+        lever_url = c.get("url")
+        if not lever_url:
+            print(f"Skipping {name}: missing url")
+            return name, None
+
+        account = extract_lever_account(lever_url)
+
+        try:
+            jobs = scrape_lever(account)
+        except Exception as e:
+            print(f"[ERROR] {name} ({account}): {e}")
+            return name, None
+
+    elif company_type == "ashby":
+        ashby_url = c.get("url")
+        if not ashby_url:
+            print(f"Skipping {name}: missing url")
+            return name, None
+
+        board_name = extract_ashby_board(ashby_url)
+
+        try:
+            jobs = scrape_ashby(board_name)
+        except Exception as e:
+            print(f"[ERROR] {name} ({board_name}): {e}")
+            return name, None
+
+    elif company_type == "workday":
+        careers_url = c.get("url")
+        if not careers_url:
+            print(f"Skipping {name}: missing url")
+            return name, None
+
+        jobs_api_url = construct_workday_jobs_api_url(careers_url)
+
+        try:
+            jobs = scrape_workday(careers_url, jobs_api_url)
+        except Exception as e:
+            print(f"[ERROR] {name}: {e}")
+            return name, None
+
+    elif company_type == "smartrecruiters":
+        smartrecruiters_url = c.get("url")
+        if not smartrecruiters_url:
+            print(f"Skipping {name}: missing url")
+            return name, None
+
+        company_identifier = extract_smartrecruiters_company(smartrecruiters_url)
+
+        try:
+            jobs = scrape_smartrecruiters(company_identifier)
+        except Exception as e:
+            print(f"[ERROR] {name} ({company_identifier}): {e}")
+            return name, None
+
+    elif company_type == "bamboo":
+        subdomain = c.get("subdomain")
+        if not subdomain:
+            # Try to extract from URL if provided
+            bamboo_url = c.get("url")
+            if bamboo_url:
+                # Extract subdomain from URL like https://company.bamboohr.com
+                parsed = urlparse(bamboo_url)
+                subdomain = parsed.netloc.split(".")[0]
+            else:
+                print(f"Skipping {name}: missing subdomain")
+                return name, None
+
+        try:
+            jobs = scrape_bamboohr(subdomain)
+        except Exception as e:
+            print(f"[ERROR] {name} ({subdomain}): {e}")
+            return name, None
+
+    elif company_type == "dover":
+        client_id = c.get("client_id")
+        cf_clearance = c.get("cf_clearance")  # Optional
+        
+        if not client_id:
+            print(f"Skipping {name}: missing client_id")
+            return name, None
+
+        try:
+            jobs = scrape_dover(client_id, cf_clearance)
+        except Exception as e:
+            print(f"[ERROR] {name} ({client_id}): {e}")
+            return name, None
+
+    elif company_type == "polymer":
+        board_url = c.get("url")
+        if not board_url:
+            print(f"Skipping {name}: missing url")
+            return name, None
+
+        try:
+            jobs = scrape_polymer_board(board_url)
+        except Exception as e:
+            print(f"[ERROR] {name}: {e}")
+            return name, None
+
+    elif company_type == "pinpoint":
+        board_url = c.get("url")
+        if not board_url:
+            print(f"Skipping {name}: missing url")
+            return name, None
+
+        try:
+            jobs = scrape_pinpoint_jobs(board_url)
+        except Exception as e:
+            print(f"[ERROR] {name}: {e}")
+            return name, None
+
+    elif company_type == "avature":
+        base_search_url = c.get("url")
+        if not base_search_url:
+            print(f"Skipping {name}: missing url")
+            return name, None
+
+        try:
+            jobs = scrape_avature_jobs(base_search_url)
+        except Exception as e:
+            print(f"[ERROR] {name}: {e}")
+            return name, None
+
+    else:
+        print(f"Skipping {name}: unsupported type '{company_type}'")
+        return name, None
+
+    # overwrite company field with friendly name (optional)
+    jobs = [Job(source, name, job_id, title, location, url) for source, _, job_id, title, location, url in jobs]
+
+    return name, jobs
+
+
 def main():
     companies = load_companies(YAML_PATH)
     if not companies:
         print(f"No companies found in {YAML_PATH}")
         return
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = connect_db(DB_PATH)
     init_db(conn)
 
-    all_new = []
+    # Scraping is network-bound, so fetch all boards concurrently; the
+    # SQLite writes below stay on this thread
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        results = list(ex.map(scrape_one, companies))
 
-    for c in companies:
-        name = c.get("name") or "Unknown"
-        company_type = c.get("type")
-        
-        if company_type == "greenhouse":
-            greenhouse_url = c.get("greenhouse_url") or c.get("url")
-            if not greenhouse_url:
-                print(f"Skipping {name}: missing greenhouse_url")
-                continue
-
-            token = extract_greenhouse_token(greenhouse_url)
-
-            try:
-                jobs = scrape_greenhouse(token)
-            except Exception as e:
-                print(f"[ERROR] {name} ({token}): {e}")
-                continue
-
-        elif company_type == "lever":
-            lever_url = c.get("url")
-            if not lever_url:
-                print(f"Skipping {name}: missing url")
-                continue
-
-            account = extract_lever_account(lever_url)
-
-            try:
-                jobs = scrape_lever(account)
-            except Exception as e:
-                print(f"[ERROR] {name} ({account}): {e}")
-                continue
-
-        elif company_type == "ashby":
-            ashby_url = c.get("url")
-            if not ashby_url:
-                print(f"Skipping {name}: missing url")
-                continue
-
-            board_name = extract_ashby_board(ashby_url)
-
-            try:
-                jobs = scrape_ashby(board_name)
-            except Exception as e:
-                print(f"[ERROR] {name} ({board_name}): {e}")
-                continue
-
-        elif company_type == "workday":
-            careers_url = c.get("url")
-            if not careers_url:
-                print(f"Skipping {name}: missing url")
-                continue
-
-            jobs_api_url = construct_workday_jobs_api_url(careers_url)
-
-            try:
-                jobs = scrape_workday(careers_url, jobs_api_url)
-            except Exception as e:
-                print(f"[ERROR] {name}: {e}")
-                continue
-
-        elif company_type == "smartrecruiters":
-            smartrecruiters_url = c.get("url")
-            if not smartrecruiters_url:
-                print(f"Skipping {name}: missing url")
-                continue
-
-            company_identifier = extract_smartrecruiters_company(smartrecruiters_url)
-
-            try:
-                jobs = scrape_smartrecruiters(company_identifier)
-            except Exception as e:
-                print(f"[ERROR] {name} ({company_identifier}): {e}")
-                continue
-
-        elif company_type == "bamboo":
-            subdomain = c.get("subdomain")
-            if not subdomain:
-                # Try to extract from URL if provided
-                bamboo_url = c.get("url")
-                if bamboo_url:
-                    # Extract subdomain from URL like https://company.bamboohr.com
-                    parsed = urlparse(bamboo_url)
-                    subdomain = parsed.netloc.split(".")[0]
-                else:
-                    print(f"Skipping {name}: missing subdomain")
-                    continue
-
-            try:
-                jobs = scrape_bamboohr(subdomain)
-            except Exception as e:
-                print(f"[ERROR] {name} ({subdomain}): {e}")
-                continue
-
-        elif company_type == "dover":
-            client_id = c.get("client_id")
-            cf_clearance = c.get("cf_clearance")  # Optional
-            
-            if not client_id:
-                print(f"Skipping {name}: missing client_id")
-                continue
-
-            try:
-                jobs = scrape_dover(client_id, cf_clearance)
-            except Exception as e:
-                print(f"[ERROR] {name} ({client_id}): {e}")
-                continue
-
-        elif company_type == "polymer":
-            board_url = c.get("url")
-            if not board_url:
-                print(f"Skipping {name}: missing url")
-                continue
-
-            try:
-                jobs = scrape_polymer_board(board_url)
-            except Exception as e:
-                print(f"[ERROR] {name}: {e}")
-                continue
-
-        elif company_type == "pinpoint":
-            board_url = c.get("url")
-            if not board_url:
-                print(f"Skipping {name}: missing url")
-                continue
-
-            try:
-                jobs = scrape_pinpoint_jobs(board_url)
-            except Exception as e:
-                print(f"[ERROR] {name}: {e}")
-                continue
-
-        elif company_type == "avature":
-            base_search_url = c.get("url")
-            if not base_search_url:
-                print(f"Skipping {name}: missing url")
-                continue
-
-            try:
-                jobs = scrape_avature_jobs(base_search_url)
-            except Exception as e:
-                print(f"[ERROR] {name}: {e}")
-                continue
-
-        else:
-            print(f"Skipping {name}: unsupported type '{company_type}'")
+    new_jobs = []
+    for name, jobs in results:
+        if jobs is None:
             continue
 
-        # overwrite company field with friendly name (optional)
-        for j in jobs:
-            j["company"] = name
+        # One transaction per board, so a posting that fails to store only
+        # costs its own board
+        try:
+            board_new = upsert_jobs(conn, jobs)
+        except Exception as e:
+            print(f"[ERROR] {name}: {e}")
+            continue
 
-        new_jobs = upsert_jobs(conn, jobs)
-        if new_jobs:
-            print(f"{name}: {len(new_jobs)} new job(s)")
-            all_new.extend(new_jobs)
+        new_jobs.extend(board_new)
+        if board_new:
+            print(f"{name}: {len(board_new)} new job(s)")
         else:
             print(f"{name}: no new jobs")
 
     conn.close()
 
-    if all_new:
+    if new_jobs:
         print("\n=== NEW JOBS ===")
         # Sort new jobs by score (highest first)
-        sorted_new = sorted(all_new, key=lambda j: score_job(j), reverse=True)
-        for j in sorted_new:
-            loc = f" ({j['location']})" if j.get("location") else ""
-            score = score_job(j)
-            print(f"[Score: {score:3d}] {j['company']}: {j['title']}{loc}\n  {j['url']}")
+        sorted_new = sorted(new_jobs, key=lambda js: js[1], reverse=True)
+        for j, score in sorted_new:
+            loc = f" ({j.location})" if j.location else ""
+            print(f"[Score: {score:3d}] {j.company}: {j.title}{loc}\n  {j.url}")
     else:
         print("\nNo new jobs found.")
 
@@ -1,10 +1,261 @@
 # scrapers.py
+import html
 import re
-import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any
 from urllib.parse import urlparse, urljoin
-from bs4 import BeautifulSoup
+
+import lxml.html
+import msgspec
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from filters import Job
+
+
+def _new_session() -> requests.Session:
+    """
+    Session with a pooled, retrying HTTPS adapter. Connections stay open between
+    requests, so repeat calls to the same host skip the TCP/TLS handshake.
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+        ),
+    )
+    return session
+
+
+# Shared by every scraper (and the worker threads in main.py) so that
+# connections to the same job board API are reused across calls
+_SESSION = _new_session()
+
+# Sent with every JSON API request. Compression needs no header here: requests
+# already advertises gzip, and br as well once the brotli package is installed.
+_JSON_HEADERS = {"Accept": "application/json"}
+
+# Patterns used per page / per link / per posting, compiled once at import
+_RE_CHARSET = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+_RE_DIGITS6 = re.compile(r"(\d{6,})")
+_RE_TAG = re.compile(r"<[^>]+>")
+# DESRES: an H5 job title, then its "Apply Now" link before any other H5 starts.
+# The href may be double-quoted, single-quoted or bare.
+_RE_DESRES_JOB = re.compile(
+    r"<h5\b[^>]*>(?P<title>(?:(?!</?h5\b).)*)</h5>"
+    r"(?:(?!<h5\b).)*?"
+    r"<a\b[^>]*?(?<![\w-])href\s*=\s*(?:\"(?P<dq>[^\"]*)\"|'(?P<sq>[^']*)'|(?P<uq>[^\s\"'>]+))[^>]*>"
+    r"\s*(?:<[^>]+>\s*)*apply\s+now\s*(?:<[^>]+>\s*)*</a>",
+    re.IGNORECASE | re.DOTALL,
+)
+_RE_H5 = re.compile(r"<h5\b", re.IGNORECASE)
+# Markup that is never rendered, so an <h5> inside it is not a heading
+_RE_UNRENDERED = re.compile(r"<!--.*?-->|<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+# Avature: "Ref #12345 • Posted 11-Aug-2025 • On-Site", read in one scan
+_RE_AVATURE_META = re.compile(r"Ref\s*#\s*(?P<ref>[0-9]+)|\u2022\s*(?P<mode>On-Site|Hybrid|Remote)\b")
+
+
+def _json(r: requests.Response):
+    # msgspec's C decoder parses the raw body several times faster than
+    # the stdlib json module behind Response.json()
+    return msgspec.json.decode(r.content)
+
+
+def _html(r: requests.Response) -> lxml.html.HtmlElement:
+    # lxml's C parser builds the tree far faster than BeautifulSoup over
+    # html.parser. It gets the raw bytes: str input is rejected when the page
+    # has an <?xml encoding=...?> prolog, and bytes let it honour the page's
+    # <meta charset>. A charset in the Content-Type header still wins, as in
+    # browsers, unless lxml does not know it (e.g. "none"). Empty documents
+    # are rejected too, so give it a stub instead.
+    m = _RE_CHARSET.search(r.headers.get("Content-Type", ""))
+    try:
+        parser = lxml.html.HTMLParser(encoding=m.group(1)) if m else None
+    except LookupError:
+        parser = None
+    return lxml.html.fromstring(r.content.strip() or b"<html></html>", parser=parser)
+
+
+# Typed payloads for the JSON APIs. msgspec decodes straight into these
+# and skips every field not declared here without building Python objects
+# for it, so only the few fields used per posting are materialized.
+# gc=False: the instances hold no reference cycles, so the cyclic GC never
+# needs to track them. Fields whose shape differs between boards are typed
+# Any, and each scraper turns them into strings (or None) before they reach
+# a Job.
+
+class _WorkdayPosting(msgspec.Struct, gc=False):
+    title: str | None = None
+    jobTitle: str | None = None
+    externalPath: str | None = None
+    url: Any = None
+    locationsText: str | None = None
+    location: Any = None
+    id: Any = None
+    jobReqId: Any = None
+
+
+class _WorkdayPage(msgspec.Struct, gc=False):
+    total: int | None = None
+    jobPostings: list[_WorkdayPosting] = []
+    items: list[_WorkdayPosting] = []
+    postings: list[_WorkdayPosting] = []
+
+    def any_postings(self) -> list[_WorkdayPosting]:
+        # Workday CXS commonly returns postings in jobPostings, but keep fallbacks
+        return self.jobPostings or self.items or self.postings
+
+
+class _GreenhouseLocation(msgspec.Struct, gc=False):
+    name: str | None = None
+
+
+class _GreenhouseJob(msgspec.Struct, gc=False):
+    id: int | str
+    title: str | None = None
+    absolute_url: str | None = None
+    location: _GreenhouseLocation | None = None
+
+
+class _GreenhouseBoard(msgspec.Struct, gc=False):
+    jobs: list[_GreenhouseJob]
+
+
+class _AshbyJob(msgspec.Struct, gc=False):
+    title: str | None = None
+    location: Any = None
+    applyUrl: str | None = None
+    jobUrl: str | None = None
+    publishedAt: str | None = None
+
+
+class _AshbyBoard(msgspec.Struct, gc=False):
+    jobs: list[_AshbyJob]
 
 
+class _LeverCategories(msgspec.Struct, gc=False):
+    location: Any = None
+
+
+class _LeverPosting(msgspec.Struct, gc=False):
+    id: Any = None
+    postingId: Any = None
+    text: str | None = None
+    categories: _LeverCategories | None = None
+    hostedUrl: str | None = None
+    applyUrl: str | None = None
+
+
+class _SmartRecruitersPosting(msgspec.Struct, gc=False):
+    id: Any = None
+    uuid: Any = None
+    ref: str | None = None
+    name: str | None = None
+    location: Any = None  # object with city/country, or a plain string
+
+
+class _SmartRecruitersPage(msgspec.Struct, gc=False):
+    content: list[_SmartRecruitersPosting] = []  # PostingList typically uses 'content'
+    totalFound: int | None = None
+
+
+class _BambooJob(msgspec.Struct, gc=False):
+    id: Any = None
+    jobId: Any = None
+    jobOpeningId: Any = None
+    job_id: Any = None
+    jobOpeningName: str | None = None
+    title: str | None = None
+    location: Any = None  # object with city/state/country, or a plain string
+    locationName: Any = None
+    atsLocation: Any = None
+    url: str | None = None
+    jobOpeningUrl: str | None = None
+    jobUrl: str | None = None
+
+
+class _BambooList(msgspec.Struct, gc=False):
+    jobs: list[Any] | None = None
+    result: list[Any] | None = None
+
+
+class _PinpointJob(msgspec.Struct, gc=False):
+    id: Any = None
+    uuid: Any = None
+    title: str | None = None
+    name: str | None = None
+    location: Any = None  # object with name/city/province, or anything else
+    locations: Any = None  # list of the same
+
+
+class _PinpointPage(msgspec.Struct, gc=False):
+    data: list[Any] | None = None
+
+
+_WORKDAY_PAGE = msgspec.json.Decoder(_WorkdayPage)
+_GREENHOUSE_BOARD = msgspec.json.Decoder(_GreenhouseBoard)
+_ASHBY_BOARD = msgspec.json.Decoder(_AshbyBoard)
+_LEVER_POSTINGS = msgspec.json.Decoder(list[_LeverPosting])
+_SMARTRECRUITERS_PAGE = msgspec.json.Decoder(_SmartRecruitersPage)
+# BambooHR and Pinpoint return either a bare list or an object wrapping it.
+# Their entries are left untyped here and converted one by one with
+# _convert_each, so a malformed entry is skipped instead of failing the board.
+_BAMBOOHR_JOBS = msgspec.json.Decoder(list[Any] | _BambooList | None)
+_PINPOINT_PAGE = msgspec.json.Decoder(list[Any] | _PinpointPage | None)
+
+
+def _convert_each(items: list, type_: type) -> list:
+    """
+    Convert each JSON object in items to type_, skipping entries that are not
+    objects or don't fit the schema.
+    """
+    out = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            out.append(msgspec.convert(item, type_))
+        except msgspec.ValidationError:
+            continue
+    return out
+
+
+def _text(value: Any) -> str | None:
+    # For fields typed Any that end up in a Job: a string as sent, the "name"
+    # of an object (how boards usually shape a location), otherwise None
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict) and isinstance(value.get("name"), str):
+        return value["name"]
+    return None
+
+
+def _fetch_concurrently(fetch, args, *, max_workers: int = 4) -> list:
+    """
+    Call fetch(arg) for each arg on a small thread pool; results keep the order of args.
+    Used for paginated APIs once the first page has revealed how many pages there are.
+    """
+    args = list(args)
+    if not args:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(args))) as ex:
+        return list(ex.map(fetch, args))
+
+
+@lru_cache(maxsize=512)
+def _origin(url: str) -> str:
+    # https://vrtx.wd501.myworkdayjobs.com/vertex_careers -> https://vrtx.wd501.myworkdayjobs.com
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+@lru_cache(maxsize=512)
 def extract_ashby_board(ashby_url: str) -> str:
     # https://jobs.ashbyhq.com/companyName -> "companyName"
     return urlparse(ashby_url).path.strip("/").split("/")[-1]
@@ -12,27 +263,23 @@ def extract_ashby_board(ashby_url: str) -> str:
 
 def scrape_ashby(board_name: str):
     url = f"https://api.ashbyhq.com/posting-api/job-board/{board_name}"
-    data = requests.get(url, timeout=20).json()
+    jobs = _ASHBY_BOARD.decode(_SESSION.get(url, headers=_JSON_HEADERS, timeout=20).content).jobs
 
-    results = []
-    for job in data["jobs"]:
+    def to_row(job: _AshbyJob) -> Job:
         # Use applyUrl if available; otherwise jobUrl
-        link = job.get("applyUrl") or job.get("jobUrl")
-
+        link = job.applyUrl or job.jobUrl
         # Create a stable id from the URL (Ashby API doesn’t guarantee a numeric id field here)
-        job_id = link.split("/")[-1] if link else f"{job.get('title','')}_{job.get('publishedAt','')}"
-
-        results.append(
-            {
-                "source": "ashby",
-                "company": board_name,
-                "job_id": job_id,
-                "title": job.get("title"),
-                "location": job.get("location"),
-                "url": link,
-            }
+        job_id = link.split("/")[-1] if link else f"{job.title or ''}_{job.publishedAt or ''}"
+        return Job(
+            source="ashby",
+            company=board_name,
+            job_id=job_id,
+            title=job.title,
+            location=_text(job.location),
+            url=link,
         )
-    return results
+
+    return [to_row(job) for job in jobs]
 
 def scrape_workday(careers_page_url: str, jobs_api_url: str, *, max_pages: int = 50):
     """
@@ -43,26 +290,47 @@ def scrape_workday(careers_page_url: str, jobs_api_url: str, *, max_pages: int =
     careers_page_url example: https://vrtx.wd501.myworkdayjobs.com/vertex_careers
     jobs_api_url example:     https://vrtx.wd501.myworkdayjobs.com/wday/cxs/vrtx/vertex_careers/jobs
     """
-    s = requests.Session()
+    s = _new_session()  # own session: Workday ties cookies to the board
 
     # Step 1: seed cookies/session
     s.get(careers_page_url, timeout=30)
 
+    origin = _origin(careers_page_url)
+
     headers = {
         "Accept": "application/json",
         "Content-Type": "application/json",
-        "Origin": careers_page_url.split("/vertex_careers")[0] if "/vertex_careers" in careers_page_url else None,
+        "Origin": origin,
         "Referer": careers_page_url,
         "User-Agent": "Mozilla/5.0",
     }
-    # Remove None header values
-    headers = {k: v for k, v in headers.items() if v is not None}
 
-    results = []
-    offset = 0
     limit = 20
 
-    for _ in range(max_pages):
+    def to_row(p: _WorkdayPosting) -> Job:
+        title = p.title or p.jobTitle
+
+        # externalPath is commonly a relative URL like "/en-US/Vertex_Careers/job/...."
+        url = p.externalPath or _text(p.url)
+
+        location = p.locationsText or _text(p.location)
+
+        # Try to find a stable identifier
+        job_id = p.id or p.jobReqId or url or title
+
+        if url and url[0] == "/":
+            url = origin + url
+
+        return Job(
+            source="workday",
+            company=careers_page_url,  # main.py will overwrite with friendly company name
+            job_id=str(job_id),
+            title=title,
+            location=location,
+            url=url,
+        )
+
+    def fetch_page(offset: int) -> tuple[int | None, list[Job]]:
         payload = {
             "appliedFacets": {},
             "limit": limit,
@@ -72,41 +340,31 @@ def scrape_workday(careers_page_url: str, jobs_api_url: str, *, max_pages: int =
 
         r = s.post(jobs_api_url, json=payload, headers=headers, timeout=30)
         r.raise_for_status()
-        data = r.json()
-
-        # Workday CXS commonly returns postings in jobPostings, but keep fallbacks
-        postings = data.get("jobPostings") or data.get("items") or data.get("postings") or []
+        # Rows are built as each page arrives (on the pool threads for later
+        # pages), so decoding overlaps other pages' network time and neither the
+        # body nor the decoded page outlives this call
+        page = _WORKDAY_PAGE.decode(r.content)
+        return page.total, [to_row(p) for p in page.any_postings()]
+
+    # The first page reports the total, so the remaining pages can be
+    # requested concurrently instead of one round trip at a time
+    total, rows = fetch_page(0)
+    pages = [rows]
+    if total:
+        offsets = range(limit, min(total, max_pages * limit), limit)
+        pages.extend(rows for _, rows in _fetch_concurrently(fetch_page, offsets))
+    else:
+        # No total reported: walk pages until one comes back empty
+        for offset in range(limit, max_pages * limit, limit):
+            if not pages[-1]:
+                break
+            pages.append(fetch_page(offset)[1])
 
-        if not postings:
+    results = []
+    for rows in pages:
+        if not rows:
             break
-
-        for p in postings:
-            title = p.get("title") or p.get("jobTitle")
-
-            # externalPath is commonly a relative URL like "/en-US/Vertex_Careers/job/...."
-            url = p.get("externalPath") or p.get("url")
-
-            location = p.get("locationsText") or p.get("location")
-
-            # Try to find a stable identifier
-            job_id = p.get("id") or p.get("jobReqId") or url or title
-
-            if url and url.startswith("/"):
-                origin = careers_page_url.split("/")[0] + "//" + careers_page_url.split("/")[2]
-                url = origin + url
-
-            results.append(
-                {
-                    "source": "workday",
-                    "company": careers_page_url,  # main.py will overwrite with friendly company name
-                    "job_id": str(job_id),
-                    "title": title,
-                    "location": location,
-                    "url": url,
-                }
-            )
-
-        offset += limit
+        results.extend(rows)
 
     return results
 
@@ -119,25 +377,20 @@ def scrape_greenhouse(board_token: str):
         jobs = scrape_greenhouse("cellarity")
     """
     url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs"
-    data = requests.get(url, timeout=20).json()
-
-    jobs = data["jobs"]  # list of job dicts
-    results = []
-
-    for job in jobs:
-        results.append(
-            {
-                "source": "greenhouse",
-                "company": board_token,
-                "job_id": job["id"],
-                "title": job["title"],
-                "location": job["location"]["name"] if job.get("location") else None,
-                "url": job["absolute_url"],
-            }
+    jobs = _GREENHOUSE_BOARD.decode(_SESSION.get(url, headers=_JSON_HEADERS, timeout=20).content).jobs
+    return [
+        Job(
+            source="greenhouse",
+            company=board_token,
+            job_id=str(job.id),
+            title=job.title,
+            location=job.location.name if job.location else None,
+            url=job.absolute_url,
         )
+        for job in jobs
+    ]
 
-    return results
-
+@lru_cache(maxsize=512)
 def extract_lever_account(lever_url: str) -> str:
     # https://jobs.lever.co/tahoebio-ai/ -> "tahoebio-ai"
     path = urlparse(lever_url).path.strip("/")
@@ -146,23 +399,21 @@ def extract_lever_account(lever_url: str) -> str:
 
 def scrape_lever(account: str):
     url = f"https://api.lever.co/v0/postings/{account}?mode=json"
-    jobs = requests.get(url, timeout=20).json()  # lever returns a LIST
-
-    results = []
-    for job in jobs:
-        results.append(
-            {
-                "source": "lever",
-                "company": account,
-                "job_id": job.get("id") or job.get("postingId") or job.get("text"),
-                "title": job.get("text"),
-                "location": job.get("categories", {}).get("location"),
-                "url": job.get("hostedUrl") or job.get("applyUrl"),
-            }
+    jobs = _LEVER_POSTINGS.decode(_SESSION.get(url, headers=_JSON_HEADERS, timeout=20).content)  # lever returns a LIST
+    return [
+        Job(
+            source="lever",
+            company=account,
+            job_id=str(job.id or job.postingId or job.text),
+            title=job.text,
+            location=_text(job.categories.location) if job.categories else None,
+            url=job.hostedUrl or job.applyUrl,
         )
-    return results
+        for job in jobs
+    ]
 
 
+@lru_cache(maxsize=512)
 def extract_smartrecruiters_company(smartrecruiters_url: str) -> str:
     # https://jobs.smartrecruiters.com/companyName -> "companyName"
     # or https://companyName.smartrecruiters.com/ -> "companyName"
@@ -183,176 +434,181 @@ def scrape_smartrecruiters(company_identifier: str, *, limit: int = 100):
     Docs: GET /v1/companies/{companyIdentifier}/postings
     """
     url = f"https://api.smartrecruiters.com/v1/companies/{company_identifier}/postings"
-    params = {"limit": limit, "offset": 0}
-    results = []
 
-    while True:
-        r = requests.get(url, params=params, timeout=30)
-        r.raise_for_status()
-        data = r.json()
+    def to_row(p: _SmartRecruitersPosting) -> Job:
+        posting_id = p.id or p.uuid or p.ref
 
-        postings = data.get("content", [])  # PostingList typically uses 'content'
-        if not postings:
-            break
+        # SmartRecruiters typically provides a 'ref' field with the job URL
+        # If not, construct it from the company identifier and posting ID
+        job_url = p.ref
+        if not job_url and posting_id:
+            job_url = f"https://jobs.smartrecruiters.com/{company_identifier}/{posting_id}"
 
-        for p in postings:
-            posting_id = p.get("id") or p.get("uuid") or p.get("ref")
-            
-            # SmartRecruiters typically provides a 'ref' field with the job URL
-            # If not, construct it from the company identifier and posting ID
-            job_url = p.get("ref")
-            if not job_url and posting_id:
-                job_url = f"https://jobs.smartrecruiters.com/{company_identifier}/{posting_id}"
-            
-            location = p.get("location")
-            location_str = None
-            if isinstance(location, dict):
-                location_str = location.get("city")
-                if location.get("country"):
-                    if location_str:
-                        location_str += f", {location.get('country')}"
-                    else:
-                        location_str = location.get("country")
-            elif isinstance(location, str):
-                location_str = location
-            
-            results.append(
-                {
-                    "source": "smartrecruiters",
-                    "company": company_identifier,
-                    "job_id": str(posting_id),
-                    "title": p.get("name"),
-                    "location": location_str,
-                    "url": job_url,
-                }
-            )
+        location = p.location
+        location_str = None
+        if isinstance(location, dict):
+            location_str = location.get("city")
+            if location.get("country"):
+                if location_str:
+                    location_str += f", {location.get('country')}"
+                else:
+                    location_str = location.get("country")
+        elif isinstance(location, str):
+            location_str = location
+
+        return Job(
+            source="smartrecruiters",
+            company=company_identifier,
+            job_id=str(posting_id),
+            title=p.name,
+            location=location_str,
+            url=job_url,
+        )
+
+    def fetch_page(offset: int) -> tuple[int | None, list[Job]]:
+        params = {"limit": limit, "offset": offset}
+        r = _SESSION.get(url, params=params, headers=_JSON_HEADERS, timeout=30)
+        r.raise_for_status()
+        page = _SMARTRECRUITERS_PAGE.decode(r.content)
+        return page.totalFound, [to_row(p) for p in page.content]
+
+    # The first page reports totalFound, so the remaining pages can be
+    # requested concurrently, as in scrape_workday
+    total, rows = fetch_page(0)
+    pages = [rows]
+    if total:
+        pages.extend(rows for _, rows in _fetch_concurrently(fetch_page, range(limit, total, limit)))
+    else:
+        # No total reported: walk pages until one comes back short
+        offset = limit
+        while len(pages[-1]) >= limit:
+            pages.append(fetch_page(offset)[1])
+            offset += limit
 
-        # pagination: if fewer than limit returned, stop
-        if len(postings) < params["limit"]:
+    results = []
+    for rows in pages:
+        if not rows:
             break
-        params["offset"] += params["limit"]
+        results.extend(rows)
 
     return results
 
 
+def _desres_headings(tree: lxml.html.HtmlElement) -> list[list]:
+    """
+    Walk headings and links once in document order: each H5 opens a job, and
+    the first "Apply Now" link before the next H5 belongs to it.
+    Returns [title, apply href or None] per H5, in page order.
+    """
+    headings = []
+    for el in tree.iter("h5", "a"):
+        if el.tag == "h5":
+            headings.append([el.text_content().strip(), None])
+        elif (
+            headings
+            and headings[-1][1] is None
+            and el.get("href") is not None
+            and el.text_content().strip().lower() == "apply now"
+        ):
+            headings[-1][1] = el.get("href")
+    return headings
+
+
 def scrape_deshawresearch_current_opportunities(
     url: str = "https://www.deshawresearch.com/current-opportunities.html",
 ):
     """
     Scrape DESRES current-opportunities page.
-    Returns list of dicts: {source, company, job_id, title, location, url}
+    Returns list of Job tuples: (source, company, job_id, title, location, url)
     """
-    r = requests.get(url, timeout=30)
+    r = _SESSION.get(url, timeout=30)
     r.raise_for_status()
 
-    soup = BeautifulSoup(r.text, "html.parser")
+    # The page uses H5 headings for each job title (as of Dec 2025), each
+    # followed by an "Apply Now" link. It is small and regular enough to pair
+    # them with one regex pass over the raw HTML instead of building a DOM.
+    # Comments, scripts and styles are cut first so their <h5>s don't count.
+    text = _RE_UNRENDERED.sub("", r.text)
+    headings = [
+        (
+            html.unescape(_RE_TAG.sub("", m["title"])).strip(),
+            html.unescape(next(h for h in m.group("dq", "sq", "uq") if h is not None)),
+        )
+        for m in _RE_DESRES_JOB.finditer(text)
+    ]
+    if len(headings) < len(_RE_H5.findall(text)):
+        # Some heading went unpaired, either a heading without a job or markup
+        # the regex doesn't cover; walk the parsed page so no job is missed
+        headings = _desres_headings(_html(r))
+        for title, href in headings:
+            if title and href is None:
+                print(f"[WARN] DESRES: no Apply Now link under heading {title!r}")
 
     results = []
 
-    # The page uses H5 headings for each job title (as of Dec 2025)
-    for h in soup.select("h5"):
-        title = h.get_text(strip=True)
-
-        if not title:
-            continue
-
-        # Find the next "Apply Now" link after this heading
-        apply_a = None
-        for a in h.find_all_next("a", href=True, limit=50):
-            if a.get_text(strip=True).lower() == "apply now":
-                apply_a = a
-                break
-            # stop if we hit the next job heading
-            if a.find_previous("h5") is not None and a.find_previous("h5") != h:
-                break
-
-        if not apply_a:
+    for title, href in headings:
+        if not title or href is None:
             continue
 
-        apply_url = urljoin(url, apply_a["href"])
+        apply_url = urljoin(url, href)
 
         # Stable-ish job_id: if their apply link contains an ID, use it; else use URL
-        m = re.search(r"(\d{6,})", apply_url)
+        m = _RE_DIGITS6.search(apply_url)
         job_id = m.group(1) if m else apply_url
 
         results.append(
-            {
-                "source": "deshawresearch",
-                "company": "D. E. Shaw Research",  # main.py will overwrite with friendly company name
-                "job_id": str(job_id),
-                "title": title,
-                "location": None,
-                "url": apply_url,
-            }
+            Job(
+                source="deshawresearch",
+                company="D. E. Shaw Research",  # main.py will overwrite with friendly company name
+                job_id=str(job_id),
+                title=title,
+                location=None,
+                url=apply_url,
+            )
         )
 
     return results
 
 
+def _join_loc(loc: Any) -> str | None:
+    # "City, State, Country" from whichever parts are present
+    if not isinstance(loc, dict):
+        return None
+    return ", ".join(v for v in (loc.get("city"), loc.get("state"), loc.get("country")) if v) or None
+
+
 def scrape_bamboohr(subdomain: str):
     """
     Scrape BambooHR jobs from a company's careers page.
-    Returns list of dicts: {source, company, job_id, title, location, url}
+    Returns list of Job tuples: (source, company, job_id, title, location, url)
     """
     url = f"https://{subdomain}.bamboohr.com/careers/list?format=json"
-    r = requests.get(url, timeout=30)
+    r = _SESSION.get(url, headers=_JSON_HEADERS, timeout=30)
     r.raise_for_status()
-    data = r.json()
+    data = _BAMBOOHR_JOBS.decode(r.content)
 
     # shape varies; commonly data["jobs"], data["result"], or data itself
     if isinstance(data, list):
         jobs = data
-    elif isinstance(data, dict):
-        jobs = data.get("jobs") or data.get("result") or []
+    elif isinstance(data, _BambooList):
+        jobs = data.jobs or data.result or []
     else:
         jobs = []
 
     results = []
-    for j in jobs:
-        # Skip if j is not a dict (shouldn't happen, but be safe)
-        if not isinstance(j, dict):
-            continue
-            
-        job_id = str(j.get("id") or j.get("jobId") or j.get("jobOpeningId") or j.get("job_id") or "")
-        title = j.get("jobOpeningName") or j.get("title")
+    for j in _convert_each(jobs, _BambooJob):
+        job_id = str(j.id or j.jobId or j.jobOpeningId or j.job_id or "")
+        title = j.jobOpeningName or j.title
         
-        # Handle location - can be string or object
-        location = j.get("location")
+        # Handle location - can be string or object, falling back to
+        # locationName / atsLocation when it is empty
+        location = j.location
         if isinstance(location, dict):
-            # Extract location from object
-            location_parts = []
-            if location.get("city"):
-                location_parts.append(location["city"])
-            if location.get("state"):
-                location_parts.append(location["state"])
-            if location.get("country"):
-                location_parts.append(location["country"])
-            # Also check atsLocation
-            if not location_parts:
-                ats_loc = j.get("atsLocation", {})
-                if ats_loc.get("city"):
-                    location_parts.append(ats_loc["city"])
-                if ats_loc.get("state"):
-                    location_parts.append(ats_loc["state"])
-                if ats_loc.get("country"):
-                    location_parts.append(ats_loc["country"])
-            location = ", ".join(location_parts) if location_parts else None
+            location = _join_loc(location) or _join_loc(j.atsLocation)
         elif not location:
-            # Try locationName or atsLocation
-            location = j.get("locationName")
-            if not location:
-                ats_loc = j.get("atsLocation", {})
-                if isinstance(ats_loc, dict):
-                    location_parts = []
-                    if ats_loc.get("city"):
-                        location_parts.append(ats_loc["city"])
-                    if ats_loc.get("state"):
-                        location_parts.append(ats_loc["state"])
-                    if ats_loc.get("country"):
-                        location_parts.append(ats_loc["country"])
-                    location = ", ".join(location_parts) if location_parts else None
+            location = j.locationName or _join_loc(j.atsLocation)
         
-        job_url = j.get("url") or j.get("jobOpeningUrl") or j.get("jobUrl")
+        job_url = j.url or j.jobOpeningUrl or j.jobUrl
         
         # Construct full URL if relative or missing
         if job_url and not job_url.startswith("http"):
@@ -362,14 +618,14 @@ def scrape_bamboohr(subdomain: str):
             if job_id:
                 job_url = f"https://{subdomain}.bamboohr.com/careers/{job_id}"
         
-        results.append({
-            "source": "bamboo",
-            "company": subdomain,  # main.py will overwrite with friendly company name
-            "job_id": job_id if job_id else job_url or title,
-            "title": title,
-            "location": location,
-            "url": job_url,
-        })
+        results.append(Job(
+            source="bamboo",
+            company=subdomain,  # main.py will overwrite with friendly company name
+            job_id=job_id or str(job_url or title),
+            title=title,
+            location=location,
+            url=job_url,
+        ))
     
     return results
 
@@ -384,20 +640,20 @@ def scrape_dover_job_groups(client_id: str, cf_clearance: str = None):
     if cf_clearance:
         cookies["cf_clearance"] = cf_clearance
     
-    r = requests.get(
+    r = _SESSION.get(
         url,
         cookies=cookies if cookies else None,
-        headers={"User-Agent": "Mozilla/5.0"},
+        headers={**_JSON_HEADERS, "User-Agent": "Mozilla/5.0"},
         timeout=30,
     )
     r.raise_for_status()
-    return r.json()
+    return _json(r)
 
 
 def scrape_dover(client_id: str, cf_clearance: str = None):
     """
     Scrape Dover jobs from job groups.
-    Returns list of dicts: {source, company, job_id, title, location, url}
+    Returns list of Job tuples: (source, company, job_id, title, location, url)
     """
     data = scrape_dover_job_groups(client_id, cf_clearance)
     
@@ -432,14 +688,14 @@ def scrape_dover(client_id: str, cf_clearance: str = None):
             elif not job_url and job_id:
                 job_url = f"https://app.dover.com/jobs/{job_id}"
             
-            results.append({
-                "source": "dover",
-                "company": client_id,  # main.py will overwrite with friendly company name
-                "job_id": job_id if job_id else job_url or title,
-                "title": title,
-                "location": location,
-                "url": job_url,
-            })
+            results.append(Job(
+                source="dover",
+                company=client_id,  # main.py will overwrite with friendly company name
+                job_id=job_id or str(job_url or title),
+                title=title,
+                location=location,
+                url=job_url,
+            ))
     
     return results
 
@@ -447,43 +703,45 @@ def scrape_dover(client_id: str, cf_clearance: str = None):
 def scrape_polymer_board(board_url: str):
     """
     Scrape Polymer job board by finding job links.
-    Returns list of dicts: {source, company, job_id, title, location, url}
+    Returns list of Job tuples: (source, company, job_id, title, location, url)
     """
-    r = requests.get(board_url, timeout=30)
+    r = _SESSION.get(board_url, timeout=30)
     r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
+    tree = _html(r)
 
     results = []
     seen_job_ids = set()
 
-    for a in soup.select('a[href]'):
-        href = a.get("href", "")
-        # Polymer "View job" links typically look like /12345 or full https://jobs.<domain>/12345
-        m = re.search(r"/(\d{3,})/?$", href)
-        if not m:
+    for a in tree.xpath("//a[@href]"):
+        href = a.get("href")
+        # Polymer "View job" links typically look like /12345 or full https://jobs.<domain>/12345.
+        # Most anchors are not job links, so reject them with plain string ops
+        tail = href[:-1] if href.endswith("/") else href
+        slash = tail.rfind("/")
+        job_id = tail[slash + 1:]
+        if slash < 0 or len(job_id) < 3 or not job_id.isdecimal():
             continue
 
-        job_id = m.group(1)
-        
         # Skip duplicates
         if job_id in seen_job_ids:
             continue
         seen_job_ids.add(job_id)
 
-        url = urljoin(board_url, href)
-        title = a.get_text(strip=True)
+        title = a.text_content().strip()
 
         if not title:
             continue
 
-        results.append({
-            "source": "polymer",
-            "company": board_url,  # main.py will overwrite with friendly company name
-            "job_id": job_id,
-            "title": title,
-            "location": None,  # Location not easily extractable from link text
-            "url": url,
-        })
+        url = urljoin(board_url, href)
+
+        results.append(Job(
+            source="polymer",
+            company=board_url,  # main.py will overwrite with friendly company name
+            job_id=job_id,
+            title=title,
+            location=None,  # Location not easily extractable from link text
+            url=url,
+        ))
 
     return results
 
@@ -491,7 +749,7 @@ def scrape_polymer_board(board_url: str):
 def scrape_pinpoint_jobs(board_url: str):
     """
     Scrape jobs from a Pinpoint HQ career board.
-    Returns list of dicts: {source, company, job_id, title, location, url}
+    Returns list of Job tuples: (source, company, job_id, title, location, url)
     E.g., board_url = "https://bighatbiosciences.pinpointhq.com/postings.json"
     """
     # Normalize base - remove /postings.json if present to get base URL
@@ -507,66 +765,70 @@ def scrape_pinpoint_jobs(board_url: str):
     else:
         api_url = f"{base_url}/postings.json"
     
+    def to_row(j: _PinpointJob) -> Job:
+        job_id = str(j.id or j.uuid or "")
+        title = j.title or j.name
+
+        # Extract location - can be in "location" (dict) or "locations" (array)
+        location = None
+        if j.location:
+            loc_obj = j.location
+            if isinstance(loc_obj, dict):
+                # Use "name" if available, otherwise construct from city/province
+                location = loc_obj.get("name")
+                if not location and loc_obj.get("city"):
+                    if loc_obj.get("province"):
+                        location = f"{loc_obj['city']}, {loc_obj['province']}"
+                    else:
+                        location = loc_obj.get("city")
+            else:
+                location = str(loc_obj)
+        elif j.locations and isinstance(j.locations, list):
+            loc_obj = j.locations[0]
+            if isinstance(loc_obj, dict):
+                location = loc_obj.get("name") or loc_obj.get("city")
+            else:
+                location = str(loc_obj)
+
+        # Construct job URL
+        job_url = f"{base_url}/en/postings/{j.id or j.uuid}"
+
+        return Job(
+            source="pinpoint",
+            company=base_url,  # main.py will overwrite with friendly company name
+            job_id=job_id or str(job_url or title),
+            title=title,
+            location=location,
+            url=job_url,
+        )
+
     results = []
     page = 1
+    prev_body = None
 
     while True:
         params = {"page": page, "per_page": 100}
-        r = requests.get(api_url, params=params, timeout=20)
+        r = _SESSION.get(api_url, params=params, headers=_JSON_HEADERS, timeout=20)
         r.raise_for_status()
-        data = r.json()
+        # Some boards ignore the page parameter and keep returning the last
+        # page; stop instead of re-parsing (and re-adding) the same jobs
+        if r.content == prev_body:
+            break
+        prev_body = r.content
+        data = _PINPOINT_PAGE.decode(r.content)
 
         # Handle different response structures: {"data": [...]} or direct list
-        jobs = data.get("data", []) if isinstance(data, dict) else data
+        jobs = data.data if isinstance(data, _PinpointPage) else data
         
-        if not isinstance(jobs, list) or len(jobs) == 0:
+        if not jobs:
             break
 
-        for j in jobs:
-            if not isinstance(j, dict):
-                continue
-                
-            job_id = str(j.get("id") or j.get("uuid") or "")
-            title = j.get("title") or j.get("name")
-            
-            # Extract location - can be in "location" (dict) or "locations" (array)
-            location = None
-            if j.get("location"):
-                loc_obj = j["location"]
-                if isinstance(loc_obj, dict):
-                    # Use "name" if available, otherwise construct from city/province
-                    location = loc_obj.get("name")
-                    if not location and loc_obj.get("city"):
-                        if loc_obj.get("province"):
-                            location = f"{loc_obj['city']}, {loc_obj['province']}"
-                        else:
-                            location = loc_obj.get("city")
-                else:
-                    location = str(loc_obj)
-            elif j.get("locations"):
-                if isinstance(j["locations"], list) and len(j["locations"]) > 0:
-                    loc_obj = j["locations"][0]
-                    if isinstance(loc_obj, dict):
-                        location = loc_obj.get("name") or loc_obj.get("city")
-                        if not location and loc_obj.get("city") and loc_obj.get("province"):
-                            location = f"{loc_obj['city']}, {loc_obj['province']}"
-                    else:
-                        location = str(loc_obj)
-            
-            # Construct job URL
-            job_url = f"{base_url}/en/postings/{j.get('id') or j.get('uuid')}"
-            
-            results.append({
-                "source": "pinpoint",
-                "company": base_url,  # main.py will overwrite with friendly company name
-                "job_id": job_id if job_id else job_url or title,
-                "title": title,
-                "location": location,
-                "url": job_url,
-            })
+        # One extend per page: the list grows once by the page's length
+        # instead of resizing as individual rows are appended
+        results.extend([to_row(j) for j in _convert_each(jobs, _PinpointJob)])
 
         # Check if there are more pages (if response has pagination info)
-        if isinstance(data, dict):
+        if isinstance(data, _PinpointPage):
             # If it's a dict with data, check if we got fewer than per_page
             if len(jobs) < params.get("per_page", 100):
                 break
@@ -582,56 +844,79 @@ def scrape_pinpoint_jobs(board_url: str):
 def scrape_avature_jobs(base_search_url: str, per_page: int = 6):
     """
     Scrape Avature job board.
-    Returns list of dicts: {source, company, job_id, title, location, url}
+    Returns list of Job tuples: (source, company, job_id, title, location, url)
     
     base_search_url example:
       https://broadinstitute.avature.net/en_US/careers
     """
     base_search_url = base_search_url.rstrip("/")
-    sess = requests.Session()
-
-    results = []
-    offset = 0
+    sess = _new_session()
 
-    while True:
+    def fetch_page(offset: int) -> tuple[bytes, list[Job]]:
         url = f"{base_search_url}/SearchJobs/?jobOffset={offset}&jobRecordsPerPage={per_page}"
         r = sess.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=30)
         r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
+        tree = _html(r)
 
+        rows = []
         # Titles are H3 links on this site
-        links = soup.select("h3 a")
-        if not links:
-            break
-
-        for a in links:
-            title = a.get_text(strip=True)
+        for a in tree.xpath("//h3//a"):
+            title = a.text_content().strip()
             job_url = urljoin(base_search_url + "/", a.get("href", ""))
 
             # Avature pages usually show "Ref #12345 • Posted 11-Aug-2025 • On-Site"
-            parent = a.find_parent()
-            meta_text = parent.get_text(" ", strip=True) if parent else ""
+            parent = a.getparent()
+            meta_text = parent.text_content() if parent is not None else ""
 
-            m_ref = re.search(r"Ref\s*#\s*([0-9]+)", meta_text)
-            m_posted = re.search(r"Posted\s+([0-9]{2}-[A-Za-z]{3}-[0-9]{4})", meta_text)
-            m_mode = re.search(r"Posted.*?\u2022\s*(On-Site|Hybrid|Remote)\b", meta_text)
+            ref = work_mode = None
+            for m in _RE_AVATURE_META.finditer(meta_text):
+                if m.lastgroup == "ref":
+                    ref = ref or m["ref"]
+                else:
+                    work_mode = work_mode or m["mode"]
+                if ref and work_mode:
+                    break
+
+            job_id = ref or job_url
 
-            job_id = m_ref.group(1) if m_ref else job_url
-            work_mode = m_mode.group(1) if m_mode else None
-            
             # Use work_mode as location hint if available
-            location = work_mode if work_mode else None
+            location = work_mode
+
+            rows.append(Job(
+                source="avature",
+                company=base_search_url,  # main.py will overwrite with friendly company name
+                job_id=str(job_id),
+                title=title,
+                location=location,
+                url=job_url,
+            ))
+
+        return r.content, rows
+
+    # Pages are small and there is no total to plan from, so keep a few pages
+    # in flight ahead of the one being consumed instead of one round trip at a time
+    prefetch = 4
+    results = []
+    prev_body = None
 
-            results.append({
-                "source": "avature",
-                "company": base_search_url,  # main.py will overwrite with friendly company name
-                "job_id": str(job_id),
-                "title": title,
-                "location": location,
-                "url": job_url,
-            })
+    with ThreadPoolExecutor(max_workers=prefetch) as ex:
+        window = deque(ex.submit(fetch_page, i * per_page) for i in range(prefetch))
+        next_offset = prefetch * per_page
 
-        offset += per_page
+        while True:
+            body, rows = window.popleft().result()
+            # Stop at the first empty page; past the end some boards repeat
+            # the last page instead of returning an empty one
+            if not rows or body == prev_body:
+                break
+            prev_body = body
+            results.extend(rows)
 
-    return results
+            window.append(ex.submit(fetch_page, next_offset))
+            next_offset += per_page
 
+        # Pages requested past the end are not needed
+        for f in window:
+            f.cancel()
+
+    return results
@@ -0,0 +1,66 @@
+import sqlite3
+
+from main import init_db
+
+
+def _indexes(conn):
+    return {name for (name,) in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='jobs' AND sql IS NOT NULL"
+    )}
+
+
+def test_init_db_migrates_baseline_schema():
+    conn = sqlite3.connect(":memory:")
+    # The original table, with its later columns appended by ALTER TABLE
+    conn.execute(
+        """
+        CREATE TABLE jobs (
+            source      TEXT NOT NULL,
+            company     TEXT NOT NULL,
+            job_id      TEXT NOT NULL,
+            title       TEXT,
+            location    TEXT,
+            url         TEXT,
+            first_seen  TEXT NOT NULL,
+            last_seen   TEXT NOT NULL,
+            PRIMARY KEY (source, company, job_id)
+        )
+        """
+    )
+    conn.execute("ALTER TABLE jobs ADD COLUMN score INTEGER DEFAULT 0")
+    conn.execute("ALTER TABLE jobs ADD COLUMN is_new INTEGER DEFAULT 0")
+    conn.execute("ALTER TABLE jobs ADD COLUMN is_applied INTEGER DEFAULT 0")
+    conn.execute("CREATE INDEX idx_jobs_new_score ON jobs (score DESC, last_seen DESC) WHERE is_new = 1")
+    rows = [
+        ("greenhouse", "Acme", "1", "ML Engineer", "Boston, MA", "https://a/1", "2025-01-01", "2025-01-02", 13, 1, 0),
+        ("lever", "Beta", "2", "Scientist", None, "https://b/2", "2025-01-01", "2025-01-01", 5, 0, 1),
+    ]
+    conn.executemany("INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+
+    init_db(conn)
+
+    assert sorted(conn.execute(
+        "SELECT source, company, job_id, title, location, url, first_seen, last_seen, score, is_new, is_applied FROM jobs"
+    )) == rows
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 3
+    assert "WITHOUT ROWID" in conn.execute("SELECT sql FROM sqlite_master WHERE name='jobs'").fetchone()[0]
+    assert _indexes(conn) == {"idx_jobs_export_cover", "idx_jobs_first_seen"}
+
+
+def test_init_db_keeps_new_database():
+    conn = sqlite3.connect(":memory:")
+    init_db(conn)
+    conn.execute("INSERT INTO jobs (source, company, job_id, first_seen, last_seen) VALUES ('a', 'b', 'c', 'd', 'e')")
+    conn.commit()
+
+    conn.execute("PRAGMA user_version = 0")
+    statements = []
+    conn.set_trace_callback(statements.append)
+    init_db(conn)
+
+    assert not any("INSERT INTO jobs_new" in sql for sql in statements)
+
+    assert conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 1
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 3
+    assert _indexes(conn) == {"idx_jobs_export_cover", "idx_jobs_first_seen"}
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+import scrapers
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode()
+        self.headers = {}
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Make every _SESSION.get return the given JSON payload."""
+    def install(payload):
+        class Session:
+            def get(self, url, **kwargs):
+                return FakeResponse(payload)
+        monkeypatch.setattr(scrapers, "_SESSION", Session())
+    return install
+
+
+def test_bamboohr_skips_null_entries(serve):
+    serve({"result": [None, {"id": 7, "jobOpeningName": "Scientist", "location": {"city": "Boston", "state": "MA"}}]})
+    jobs = scrapers.scrape_bamboohr("acme")
+    assert [(j.job_id, j.title, j.location) for j in jobs] == [("7", "Scientist", "Boston, MA")]
+
+
+def test_bamboohr_ignores_non_object_ats_location(serve):
+    serve({"result": [
+        {"id": 8, "title": "Engineer", "atsLocation": []},
+        {"id": 9, "title": "Analyst", "location": {}, "atsLocation": []},
+    ]})
+    jobs = scrapers.scrape_bamboohr("acme")
+    assert [(j.job_id, j.location) for j in jobs] == [("8", None), ("9", None)]
+
+
+def test_pinpoint_keeps_non_object_location(serve):
+    serve({"data": [{"id": 1, "title": "Scientist", "location": 5}]})
+    jobs = scrapers.scrape_pinpoint_jobs("https://acme.pinpointhq.com")
+    assert [(j.job_id, j.title, j.location) for j in jobs] == [("1", "Scientist", "5")]
+
+
+@pytest.mark.parametrize("charset", ["none", "x-user-defined"])
+def test_html_ignores_unknown_header_charset(charset):
+    r = FakeResponse(None)
+    r.content = b'<html><head><meta charset="utf-8"></head><body><h5>Caf\xc3\xa9</h5></body></html>'
+    r.headers = {"Content-Type": f"text/html; charset={charset}"}
+    assert scrapers._html(r).findtext(".//h5") == "Café"
+
+
+def test_ashby_location_object(serve):
+    serve({"jobs": [{"title": "Scientist", "location": {"name": "Boston"}, "jobUrl": "https://jobs.ashbyhq.com/acme/abc"}]})
+    jobs = scrapers.scrape_ashby("acme")
+    assert [(j.job_id, j.location) for j in jobs] == [("abc", "Boston")]
+
+
+def test_lever_drops_non_string_location(serve):
+    serve([{"id": "x1", "text": "Engineer", "categories": {"location": ["Boston", "Remote"]}}])
+    jobs = scrapers.scrape_lever("acme")
+    assert [(j.job_id, j.location) for j in jobs] == [("x1", None)]
+
+
+def test_workday_drops_non_string_url_and_location(monkeypatch):
+    class Session:
+        def get(self, url, **kwargs):
+            return FakeResponse(None)
+
+        def post(self, url, **kwargs):
+            return FakeResponse({"total": 1, "jobPostings": [
+                {"title": "Engineer", "id": "R1", "url": {"href": "/job/1"}, "location": 5},
+            ]})
+    monkeypatch.setattr(scrapers, "_new_session", Session)
+    jobs = scrapers.scrape_workday("https://acme.wd1.myworkdayjobs.com/careers", "https://acme.wd1.myworkdayjobs.com/wday/cxs/acme/careers/jobs")
+    assert [(j.job_id, j.location, j.url) for j in jobs] == [("R1", None, None)]